@@ -0,0 +1,19 @@
+import hashlib
+
+
+def hash_many(msgs: list[bytes]) -> list[str]:
+    """Hash a batch of byte strings with SHA-256 in one pass.
+
+    Amortizes per-call lookup overhead across the whole batch and gives
+    the analyzers a single entry point for bulk hashing, so a
+    multi-buffer backend (e.g. Intel ISA-L's sha256 context manager)
+    can be dropped in here without touching the callers.
+    """
+    sha256 = hashlib.sha256
+    return [sha256(msg).hexdigest() for msg in msgs]
+
+
+def digest_many(msgs: list[bytes]) -> list[bytes]:
+    """Like hash_many but returns raw 32-byte digests."""
+    sha256 = hashlib.sha256
+    return [sha256(msg).digest() for msg in msgs]
@@ -1,13 +1,39 @@
 import time
 import random
 import string
-import statistics
-from collections import defaultdict
-import matplotlib.pyplot as plt
+import numpy as np
 import smhash
 from sha256 import SHA256
 
 
+# Alphanumeric pool as bytes so test inputs can be generated without an
+# intermediate str -> encode step
+_ASCII_POOL_BYTES = (string.ascii_letters + string.digits).encode('ascii')
+_ALPHABET = np.frombuffer(_ASCII_POOL_BYTES, dtype=np.uint8)
+_rng = np.random.default_rng()
+
+
+def _gen_bytes_batch(n, length=10):
+    """Generate n random ASCII byte strings of given length in one shot."""
+    idx = _rng.integers(0, len(_ALPHABET), size=(n, length))
+    arr = _ALPHABET[idx]
+    return [row.tobytes() for row in arr]
+
+
+def _gen_bytes_pairs_batch(n, length=10):
+    """Generate n pairs of byte strings differing by one bit in the last byte.
+
+    The whole batch is mutated with a single vectorized XOR; like the
+    scalar chr(ord(c) ^ 1) mutation, the flipped byte may fall outside
+    the alphabet.
+    """
+    idx = _rng.integers(0, len(_ALPHABET), size=(n, length))
+    originals = _ALPHABET[idx]
+    modified = originals.copy()
+    modified[:, -1] ^= 1
+    return [(originals[i].tobytes(), modified[i].tobytes()) for i in range(n)]
+
+
 class CryptoAnalyzer:
     def __init__(self):
         self.sha256 = SHA256()
@@ -16,13 +42,14 @@ class CryptoAnalyzer:
         """Generate a random string of given length."""
         return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
 
-    def hex_to_binary(self, hex_str: str) -> str:
-        """Convert a hexadecimal string to binary string."""
-        return ''.join(bin(int(c, 16))[2:].zfill(4) for c in hex_str)
+    def generate_random_bytes(self, length=10):
+        """Generate a random ASCII byte string of given length."""
+        return bytes(random.choices(_ASCII_POOL_BYTES, k=length))
 
-    def hamming_distance(self, str1: str, str2: str) -> int:
-        """Calculate the Hamming distance between two binary strings."""
-        return sum(c1 != c2 for c1, c2 in zip(str1, str2))
+    def hamming_distance(self, hash1: str, hash2: str) -> int:
+        """Calculate the Hamming distance between two hex hash strings."""
+        # XOR the digests as integers and popcount the result
+        return (int(hash1, 16) ^ int(hash2, 16)).bit_count()
 
     def test_preimage_resistance(self, num_tests=1000, target_prefix='00'):
         """
@@ -32,32 +59,54 @@ class CryptoAnalyzer:
         sha256_attempts = []
         smhash_attempts = []
 
+        # Convert the hex prefix once so candidates are checked on raw
+        # digest bytes, without formatting 64 hex chars per attempt
+        prefix_len = len(target_prefix) // 2
+        prefix_bytes = bytes.fromhex(target_prefix[:prefix_len * 2])
+        prefix_nibble = int(target_prefix[-1], 16) if len(target_prefix) % 2 else None
+
+        def matches(digest: bytes) -> bool:
+            if digest[:prefix_len] != prefix_bytes:
+                return False
+            return prefix_nibble is None or digest[prefix_len] >> 4 == prefix_nibble
+
+        # Bind the hot callables to locals once, outside the search loops
+        sm_digest = smhash.digest_bytes
+        sha_digest = self.sha256.digest
+
         for _ in range(num_tests):
+            # Generate candidates in blocks to amortize RNG overhead
             attempts = 0
-            while True:
-                attempts += 1
-                test_str = self.generate_random_string()
-                if smhash.hash_string(test_str).startswith(target_prefix):
-                    smhash_attempts.append(attempts)
-                    break
-                if attempts > 10000:  # Limit attempts to prevent infinite loops
-                    smhash_attempts.append(10000)
-                    break
+            searching = True
+            while searching:
+                for test_bytes in _gen_bytes_batch(1024):
+                    attempts += 1
+                    if matches(sm_digest(test_bytes)):
+                        smhash_attempts.append(attempts)
+                        searching = False
+                        break
+                    if attempts > 10000:  # Limit attempts to prevent infinite loops
+                        smhash_attempts.append(10000)
+                        searching = False
+                        break
 
             attempts = 0
-            while True:
-                attempts += 1
-                test_str = self.generate_random_string()
-                if self.sha256.hash(test_str.encode('utf-8')).startswith(target_prefix):
-                    sha256_attempts.append(attempts)
-                    break
-                if attempts > 10000:
-                    sha256_attempts.append(10000)
-                    break
+            searching = True
+            while searching:
+                for test_bytes in _gen_bytes_batch(1024):
+                    attempts += 1
+                    if matches(sha_digest(test_bytes)):
+                        sha256_attempts.append(attempts)
+                        searching = False
+                        break
+                    if attempts > 10000:
+                        sha256_attempts.append(10000)
+                        searching = False
+                        break
 
         return {
-            'sha256_avg_attempts': statistics.mean(sha256_attempts),
-            'smhash_avg_attempts': statistics.mean(smhash_attempts),
+            'sha256_avg_attempts': float(np.mean(sha256_attempts)),
+            'smhash_avg_attempts': float(np.mean(smhash_attempts)),
             'sha256_attempts': sha256_attempts,
             'smhash_attempts': smhash_attempts
         }
@@ -70,31 +119,32 @@ class CryptoAnalyzer:
         sha256_collisions = []
         smhash_collisions = []
 
-        for _ in range(num_pairs):
-            # Generate two similar strings
-            str1 = self.generate_random_string()
-            str2 = str1[:-1] + chr(ord(str1[-1]) ^ 1)
+        # Generate all pairs of similar inputs up front, already encoded
+        pairs = _gen_bytes_pairs_batch(num_pairs)
+
+        # Bind the hot callables to locals once, outside the loop
+        sha_hash = self.sha256.hash
+        sm_hash = smhash.hash_bytes
+        ham = self.hamming_distance
 
+        for bytes1, bytes2 in pairs:
             # Get hashes
-            sha256_hash1 = self.sha256.hash(str1.encode('utf-8'))
-            sha256_hash2 = self.sha256.hash(str2.encode('utf-8'))
-            smhash_hash1 = smhash.hash_string(str1)
-            smhash_hash2 = smhash.hash_string(str2)
+            sha256_hash1 = sha_hash(bytes1)
+            sha256_hash2 = sha_hash(bytes2)
+            smhash_hash1 = sm_hash(bytes1)
+            smhash_hash2 = sm_hash(bytes2)
 
             # Check for partial collisions (matching bits)
-            sha256_bin1 = self.hex_to_binary(sha256_hash1)
-            sha256_bin2 = self.hex_to_binary(sha256_hash2)
-            smhash_bin1 = self.hex_to_binary(smhash_hash1)
-            smhash_bin2 = self.hex_to_binary(smhash_hash2)
-
-            sha256_collisions.append(self.hamming_distance(sha256_bin1, sha256_bin2))
-            smhash_collisions.append(self.hamming_distance(smhash_bin1, smhash_bin2))
+            sha256_collisions.append(ham(sha256_hash1, sha256_hash2))
+            smhash_collisions.append(ham(smhash_hash1, smhash_hash2))
 
+        sha256_arr = np.asarray(sha256_collisions)
+        smhash_arr = np.asarray(smhash_collisions)
         return {
-            'sha256_avg_diff': statistics.mean(sha256_collisions),
-            'smhash_avg_diff': statistics.mean(smhash_collisions),
-            'sha256_min_diff': min(sha256_collisions),
-            'smhash_min_diff': min(smhash_collisions)
+            'sha256_avg_diff': float(sha256_arr.mean()),
+            'smhash_avg_diff': float(smhash_arr.mean()),
+            'sha256_min_diff': int(sha256_arr.min()),
+            'smhash_min_diff': int(smhash_arr.min())
         }
 
     def test_avalanche_effect(self, num_tests=1000):
@@ -104,59 +154,70 @@ class CryptoAnalyzer:
         sha256_changes = []
         smhash_changes = []
 
-        for _ in range(num_tests):
-            # Generate original string and modified string (1 bit different)
-            orig_str = self.generate_random_string()
-            mod_str = orig_str[:-1] + chr(ord(orig_str[-1]) ^ 1)
+        # Generate all original/modified input pairs up front, already encoded
+        pairs = _gen_bytes_pairs_batch(num_tests)
 
+        # Bind the hot callables to locals once, outside the loop
+        sha_hash = self.sha256.hash
+        sm_hash = smhash.hash_bytes
+        ham = self.hamming_distance
+
+        for orig_bytes, mod_bytes in pairs:
             # Get original and modified hashes
-            sha256_orig = self.hex_to_binary(self.sha256.hash(orig_str.encode('utf-8')))
-            sha256_mod = self.hex_to_binary(self.sha256.hash(mod_str.encode('utf-8')))
-            smhash_orig = self.hex_to_binary(smhash.hash_string(orig_str))
-            smhash_mod = self.hex_to_binary(smhash.hash_string(mod_str))
+            sha256_orig = sha_hash(orig_bytes)
+            sha256_mod = sha_hash(mod_bytes)
+            smhash_orig = sm_hash(orig_bytes)
+            smhash_mod = sm_hash(mod_bytes)
 
-            # Calculate percentage of bits changed
-            sha256_changes.append(self.hamming_distance(sha256_orig, sha256_mod) / len(sha256_orig) * 100)
-            smhash_changes.append(self.hamming_distance(smhash_orig, smhash_mod) / len(smhash_orig) * 100)
+            # Calculate percentage of bits changed (4 bits per hex digit)
+            sha256_changes.append(ham(sha256_orig, sha256_mod) / (len(sha256_orig) * 4) * 100)
+            smhash_changes.append(ham(smhash_orig, smhash_mod) / (len(smhash_orig) * 4) * 100)
 
+        sha256_arr = np.asarray(sha256_changes)
+        smhash_arr = np.asarray(smhash_changes)
         return {
-            'sha256_avg_change': statistics.mean(sha256_changes),
-            'smhash_avg_change': statistics.mean(smhash_changes),
-            'sha256_std_dev': statistics.stdev(sha256_changes),
-            'smhash_std_dev': statistics.stdev(smhash_changes)
+            'sha256_avg_change': float(sha256_arr.mean()),
+            'smhash_avg_change': float(smhash_arr.mean()),
+            'sha256_std_dev': float(sha256_arr.std(ddof=1)),
+            'smhash_std_dev': float(smhash_arr.std(ddof=1))
         }
 
     def test_distribution_uniformity(self, num_tests=10000):
         """
         Test the uniformity of hash distribution across the output space.
         """
-        sha256_dist = defaultdict(int)
-        smhash_dist = defaultdict(int)
-
-        for _ in range(num_tests):
-            input_str = self.generate_random_string()
+        input_pool = _gen_bytes_batch(num_tests)
 
-            sha256_hash = self.sha256.hash(input_str.encode('utf-8'))[:2]  # First byte
-            smhash_hash = smhash.hash_string(input_str)[:2]  # First byte
+        sha_hash = self.sha256.hash
+        sm_hash = smhash.hash_bytes
+        sha256_hashes = [sha_hash(input_bytes) for input_bytes in input_pool]
+        smhash_hashes = [sm_hash(input_bytes) for input_bytes in input_pool]
 
-            sha256_dist[sha256_hash] += 1
-            smhash_dist[smhash_hash] += 1
+        # Histogram the first byte of every hash in one C-level pass
+        sha256_first = np.frombuffer(bytes.fromhex(''.join(h[:2] for h in sha256_hashes)), dtype=np.uint8)
+        smhash_first = np.frombuffer(bytes.fromhex(''.join(h[:2] for h in smhash_hashes)), dtype=np.uint8)
+        sha256_counts = np.bincount(sha256_first, minlength=256)
+        smhash_counts = np.bincount(smhash_first, minlength=256)
 
         # Calculate chi-square statistic for uniformity
         expected = num_tests / 256  # Expected count for perfect uniformity
 
-        sha256_chi = sum((obs - expected) ** 2 / expected for obs in sha256_dist.values())
-        smhash_chi = sum((obs - expected) ** 2 / expected for obs in smhash_dist.values())
+        sha256_chi = float(((sha256_counts - expected) ** 2 / expected).sum())
+        smhash_chi = float(((smhash_counts - expected) ** 2 / expected).sum())
 
         return {
             'sha256_chi_square': sha256_chi,
             'smhash_chi_square': smhash_chi,
-            'sha256_distribution': dict(sha256_dist),
-            'smhash_distribution': dict(smhash_dist)
+            'sha256_distribution': {f'{i:02x}': int(count) for i, count in enumerate(sha256_counts) if count},
+            'smhash_distribution': {f'{i:02x}': int(count) for i, count in enumerate(smhash_counts) if count}
         }
 
     def plot_security_metrics(self, avalanche_results, distribution_results):
         """Plot security metrics for visual comparison."""
+        # Imported lazily so benchmark-only runs skip matplotlib's
+        # startup and memory cost
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(15, 10))
 
         # Plot avalanche effect
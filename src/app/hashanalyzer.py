@@ -2,11 +2,40 @@ import time
 import random
 import string
 from collections import defaultdict
-import matplotlib.pyplot as plt
+import numpy as np
+import batch
 import smhash
 from sha256 import SHA256
 
 
+# Alphanumeric pool as bytes so test inputs can be generated without an
+# intermediate str -> encode step
+_ASCII_POOL_BYTES = (string.ascii_letters + string.digits).encode('ascii')
+_ALPHABET = np.frombuffer(_ASCII_POOL_BYTES, dtype=np.uint8)
+_rng = np.random.default_rng()
+
+
+def _gen_bytes_batch(n, length=10):
+    """Generate n random ASCII byte strings of given length in one shot."""
+    idx = _rng.integers(0, len(_ALPHABET), size=(n, length))
+    arr = _ALPHABET[idx]
+    return [row.tobytes() for row in arr]
+
+
+def _gen_bytes_pairs_batch(n, length=10):
+    """Generate n pairs of byte strings differing by one bit in the last byte.
+
+    The whole batch is mutated with a single vectorized XOR; like the
+    scalar chr(ord(c) ^ 1) mutation, the flipped byte may fall outside
+    the alphabet.
+    """
+    idx = _rng.integers(0, len(_ALPHABET), size=(n, length))
+    originals = _ALPHABET[idx]
+    modified = originals.copy()
+    modified[:, -1] ^= 1
+    return [(originals[i].tobytes(), modified[i].tobytes()) for i in range(n)]
+
+
 class HashAnalyzer:
     def __init__(self):
         self.sha256 = SHA256()
@@ -16,27 +45,29 @@ class HashAnalyzer:
         """Generate a random string of given length."""
         return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
 
+    def generate_random_bytes(self, length=10):
+        """Generate a random ASCII byte string of given length."""
+        return bytes(random.choices(_ASCII_POOL_BYTES, k=length))
+
     def bit_difference(self, hash1: str, hash2: str) -> int:
         """Calculate the number of different bits between two hash strings."""
-        # Convert hex strings to binary
-        bin1 = ''.join(bin(int(c, 16))[2:].zfill(4) for c in hash1)
-        bin2 = ''.join(bin(int(c, 16))[2:].zfill(4) for c in hash2)
-        return sum(b1 != b2 for b1, b2 in zip(bin1, bin2))
+        # XOR the digests as integers and popcount the result
+        return (int(hash1, 16) ^ int(hash2, 16)).bit_count()
 
     def speed_test(self, num_iterations=1000):
         """Compare speed of both hash functions."""
-        test_data = [self.generate_random_string() for _ in range(num_iterations)]
+        test_data = _gen_bytes_batch(num_iterations)
 
-        # Test SHA-256
+        # Test SHA-256 (batched; input generation done outside the timed region)
         start_time = time.perf_counter()
-        for data in test_data:
-            self.sha256.hash(data.encode('utf-8'))
+        batch.hash_many(test_data)
         sha256_time = time.perf_counter() - start_time
 
         # Test smhash
+        sm_hash = smhash.hash_bytes
         start_time = time.perf_counter()
         for data in test_data:
-            smhash.hash_string(data)
+            sm_hash(data)
         smhash_time = time.perf_counter() - start_time
 
         return {
@@ -52,20 +83,26 @@ class HashAnalyzer:
         sha256_differences = []
         smhash_differences = []
 
-        for _ in range(num_tests):
-            # Generate two strings that differ by one character
-            str1 = self.generate_random_string()
-            str2 = str1[:-1] + chr(ord(str1[-1]) ^ 1)  # Flip one bit in last char
+        # Generate all pairs of inputs that differ by one bit in the last byte
+        pairs = _gen_bytes_pairs_batch(num_tests)
 
-            # Get hashes
-            sha256_hash1 = self.sha256.hash(str1.encode('utf-8'))
-            sha256_hash2 = self.sha256.hash(str2.encode('utf-8'))
-            smhash_hash1 = smhash.hash_string(str1)
-            smhash_hash2 = smhash.hash_string(str2)
+        # Hash the whole interleaved batch in one pass
+        interleaved = [b for pair in pairs for b in pair]
+        sha256_hashes = batch.hash_many(interleaved)
+
+        # Bind the hot callables to locals once, outside the loop
+        sm_hash = smhash.hash_bytes
+        bit_diff = self.bit_difference
+
+        for i, (bytes1, bytes2) in enumerate(pairs):
+            sha256_hash1 = sha256_hashes[2 * i]
+            sha256_hash2 = sha256_hashes[2 * i + 1]
+            smhash_hash1 = sm_hash(bytes1)
+            smhash_hash2 = sm_hash(bytes2)
 
             # Calculate bit differences
-            sha256_diff = self.bit_difference(sha256_hash1, sha256_hash2)
-            smhash_diff = self.bit_difference(smhash_hash1, smhash_hash2)
+            sha256_diff = bit_diff(sha256_hash1, sha256_hash2)
+            smhash_diff = bit_diff(smhash_hash1, smhash_hash2)
 
             sha256_differences.append(sha256_diff)
             smhash_differences.append(smhash_diff)
@@ -82,11 +119,12 @@ class HashAnalyzer:
         sha256_first_bytes = defaultdict(int)
         smhash_first_bytes = defaultdict(int)
 
-        for _ in range(num_tests):
-            test_str = self.generate_random_string()
+        test_pool = _gen_bytes_batch(num_tests)
+        sha256_hashes = batch.hash_many(test_pool)
 
-            sha256_hash = self.sha256.hash(test_str.encode('utf-8'))
-            smhash_hash = smhash.hash_string(test_str)
+        sm_hash = smhash.hash_bytes
+        for test_bytes, sha256_hash in zip(test_pool, sha256_hashes):
+            smhash_hash = sm_hash(test_bytes)
 
             # Count distribution of first byte
             sha256_first_bytes[sha256_hash[:2]] += 1
@@ -103,12 +141,12 @@ class HashAnalyzer:
         smhash_hashes = set()
         inputs = set()
 
-        for _ in range(num_tests):
-            test_str = self.generate_random_string(5)  # Small strings to increase collision chance
-            inputs.add(test_str)
+        test_pool = _gen_bytes_batch(num_tests, length=5)  # Small strings to increase collision chance
+        inputs.update(test_pool)
 
-            sha256_hashes.add(self.sha256.hash(test_str.encode('utf-8')))
-            smhash_hashes.add(smhash.hash_string(test_str))
+        sha256_hashes.update(batch.hash_many(test_pool))
+        sm_hash = smhash.hash_bytes
+        smhash_hashes.update(sm_hash(test_bytes) for test_bytes in test_pool)
 
         return {
             'inputs': len(inputs),
@@ -118,6 +156,10 @@ class HashAnalyzer:
 
     def plot_distribution(self, distribution_data):
         """Plot hash value distributions."""
+        # Imported lazily so benchmark-only runs skip matplotlib's
+        # startup and memory cost
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(15, 5))
 
         # SHA-256 distribution
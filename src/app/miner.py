@@ -1,60 +1,149 @@
-import sha256
+import hashlib
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 import smhash
 
 
 
-def hash_sha256_with_nonce(text: str, nonce: int) -> str:
-    """Create SHA-256 hash of the text combined with nonce"""
-    return sha256.hash_string(f"{text}{nonce}")
+# Nonce block size for the sequential sweeps (progress is reported per
+# block, keeping the inner loop branch-free)
+_NONCE_BLOCK = 100000
+
+
+def digest_sha256_with_nonce(text: str, nonce: int) -> bytes:
+    """Create raw SHA-256 digest of the text combined with nonce"""
+    return hashlib.sha256(text.encode() + b"%d" % nonce).digest()
+
+
+def _zero_prefix_check(num_zeros: int):
+    """Build a checker for num_zeros leading hex zeros on a raw digest.
+
+    Only the first ceil(num_zeros / 2) bytes are inspected, so the hex
+    string is never formatted for non-matching candidates.
+    """
+    full_zero = num_zeros // 2
+    nibble = num_zeros & 1
+    zeros = b'\x00' * full_zero
+
+    def check(digest: bytes) -> bool:
+        return digest[:full_zero] == zeros and (nibble == 0 or digest[full_zero] >> 4 == 0)
+
+    return check
 
 
 def mine_sha_256_hash(text: str, num_zeros: int, max_nonce: int = 10000000) -> None:
     """Mine for a hash with specified number of leading zeros"""
-    target = '0' * num_zeros
+    check = _zero_prefix_check(num_zeros)
+    # Hash the shared text prefix once; each nonce restarts from a copy
+    # of that state instead of re-hashing the prefix
+    base = hashlib.sha256(text.encode())
     start_time = time.perf_counter()
 
-    for nonce in range(max_nonce):
-        if nonce % 100000 == 0:  # Progress update every 100,000 attempts
-            print(f"Trying nonce: {nonce}")
-
-        current_hash = hash_sha256_with_nonce(text, nonce)
-        if current_hash.startswith(target):
-            end_time = time.perf_counter()
-            print(f"\nSuccess! Found matching hash:")
-            print(f"Text: {text}")
-            print(f"Nonce: {nonce}")
-            print(f"Hash: {current_hash}")
-            print(f"Time taken: {end_time - start_time:.4f} seconds")
-            print(f"Hashes calculated: {nonce:,}")
-            print(f"Hashes per second: {nonce / (end_time - start_time):,.2f}")
-            return
+    # Sweep the nonce space in fixed-size blocks so the inner loop stays
+    # free of progress bookkeeping; a GPU kernel launch per block would
+    # slot in here with the same granularity
+    for block_start in range(0, max_nonce, _NONCE_BLOCK):
+        print(f"Trying nonce: {block_start}")
+
+        for nonce in range(block_start, min(block_start + _NONCE_BLOCK, max_nonce)):
+            hasher = base.copy()
+            hasher.update(b"%d" % nonce)  # bytes interpolation, no str round-trip
+            digest = hasher.digest()
+            if check(digest):
+                end_time = time.perf_counter()
+                print(f"\nSuccess! Found matching hash:")
+                print(f"Text: {text}")
+                print(f"Nonce: {nonce}")
+                print(f"Hash: {digest.hex()}")
+                print(f"Time taken: {end_time - start_time:.4f} seconds")
+                print(f"Hashes calculated: {nonce:,}")
+                print(f"Hashes per second: {nonce / (end_time - start_time):,.2f}")
+                return
 
     print(f"Could not find a matching hash after {max_nonce:,} attempts")
 
-def hash_smhash_with_nonce(text: str, nonce: int) -> str:
-    """Create SHA-256 hash of the text combined with nonce"""
-    return smhash.hash_string(f"{text}{nonce}")
+def _search_sha256_range(text: str, start: int, stop: int, num_zeros: int) -> int:
+    """Scan nonces in [start, stop) for a matching SHA-256 hash.
+
+    Worker for the parallel miner; returns the first matching nonce in
+    the range, or -1.
+    """
+    check = _zero_prefix_check(num_zeros)
+    base = hashlib.sha256(text.encode())
+    for nonce in range(start, stop):
+        hasher = base.copy()
+        hasher.update(b"%d" % nonce)
+        if check(hasher.digest()):
+            return nonce
+    return -1
+
+
+def mine_sha_256_hash_parallel(text: str, num_zeros: int, max_nonce: int = 10000000,
+                               chunk_size: int = 200000) -> None:
+    """Mine for a hash with specified number of leading zeros using all cores.
+
+    The nonce space is split into chunks dispatched to a process pool;
+    chunks are drained in nonce order so the result matches the
+    sequential miner.
+    """
+    start_time = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = [
+            pool.submit(_search_sha256_range, text, start, min(start + chunk_size, max_nonce), num_zeros)
+            for start in range(0, max_nonce, chunk_size)
+        ]
+        for future in futures:
+            nonce = future.result()
+            if nonce != -1:
+                for pending in futures:
+                    pending.cancel()
+                end_time = time.perf_counter()
+                digest = digest_sha256_with_nonce(text, nonce)
+                print(f"\nSuccess! Found matching hash:")
+                print(f"Text: {text}")
+                print(f"Nonce: {nonce}")
+                print(f"Hash: {digest.hex()}")
+                print(f"Time taken: {end_time - start_time:.4f} seconds")
+                print(f"Hashes calculated: {nonce:,}")
+                print(f"Hashes per second: {nonce / (end_time - start_time):,.2f}")
+                return
+
+    print(f"Could not find a matching hash after {max_nonce:,} attempts")
+
+
+def digest_smhash_with_nonce(text: str, nonce: int) -> bytes:
+    """Create raw smhash digest of the text combined with nonce"""
+    hasher = smhash.BlockHash(smhash.MiningMode.STANDARD)
+    hasher.update(text.encode() + b"%d" % nonce)
+    return hasher.digest()
 def mine_smhash_hash(text: str, num_zeros: int, max_nonce: int = 10000000) -> None:
     """Mine for a hash with specified number of leading zeros"""
-    target = '0' * num_zeros
+    check = _zero_prefix_check(num_zeros)
+    # Absorb the shared text prefix once; each nonce rewinds the same
+    # hasher to that midstate instead of constructing a new one
+    hasher = smhash.BlockHash(smhash.MiningMode.STANDARD)
+    mid_state, mid_buffer = hasher.prepare_midstate(text.encode())
     start_time = time.perf_counter()
 
-    for nonce in range(max_nonce):
-        if nonce % 100000 == 0:  # Progress update every 100,000 attempts
-            print(f"Trying nonce: {nonce}")
-
-        current_hash = hash_smhash_with_nonce(text, nonce)
-        if current_hash.startswith(target):
-            end_time = time.perf_counter()
-            print(f"\nSuccess! Found matching hash:")
-            print(f"Text: {text}")
-            print(f"Nonce: {nonce}")
-            print(f"Hash: {current_hash}")
-            print(f"Time taken: {end_time - start_time:.4f} seconds")
-            print(f"Hashes calculated: {nonce:,}")
-            print(f"Hashes per second: {nonce / (end_time - start_time):,.2f}")
-            return
+    for block_start in range(0, max_nonce, _NONCE_BLOCK):
+        print(f"Trying nonce: {block_start}")
+
+        for nonce in range(block_start, min(block_start + _NONCE_BLOCK, max_nonce)):
+            hasher.reset_from(mid_state, mid_buffer)
+            hasher.update(b"%d" % nonce)
+            digest = hasher._digest_destructive()
+            if check(digest):
+                end_time = time.perf_counter()
+                print(f"\nSuccess! Found matching hash:")
+                print(f"Text: {text}")
+                print(f"Nonce: {nonce}")
+                print(f"Hash: {digest.hex()}")
+                print(f"Time taken: {end_time - start_time:.4f} seconds")
+                print(f"Hashes calculated: {nonce:,}")
+                print(f"Hashes per second: {nonce / (end_time - start_time):,.2f}")
+                return
 
     print(f"Could not find a matching hash after {max_nonce:,} attempts")
 